@@ -1,6 +1,104 @@
+import bisect
+import heapq
+
 import matplotlib.pyplot as plt
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, the kernels just run as plain Python without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# The kernels below expect processes already sorted by arrival time
+
+def _fcfs_kernel(arrival, burst):
+    # The closed form is exact for integers only; float times use the sequential loop
+    if arrival.dtype.kind not in 'iu':
+        return _fcfs_loop_kernel(arrival, burst)
+
+    # completion[i] = max(completion[i-1], arrival[i]) + burst[i], solved with a running max:
+    # shifting by the burst prefix sums turns the recurrence into a plain maximum.accumulate
+    burst_total = np.cumsum(burst)
+    start_shift = np.maximum.accumulate(np.maximum(arrival - (burst_total - burst), 0))
+    completion = start_shift + burst_total
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    # Processes finish in arrival order
+    order = np.arange(arrival.shape[0])
+    return waiting, completion, turnaround, order
+
+@njit(cache=True)
+def _fcfs_loop_kernel(arrival, burst):
+    n = arrival.shape[0]
+    waiting = np.empty_like(arrival)
+    completion = np.empty_like(arrival)
+    turnaround = np.empty_like(arrival)
+    current_time = 0
+
+    for i in range(n):
+        if current_time < arrival[i]:
+            current_time = arrival[i]
+
+        waiting[i] = current_time - arrival[i]
+        completion[i] = current_time + burst[i]
+        turnaround[i] = completion[i] - arrival[i]
+        current_time = completion[i]
+    return waiting, completion, turnaround, np.arange(n)
+
+@njit(cache=True)
+def _lowest_key_kernel(arrival, burst, key):
+    n = arrival.shape[0]
+    waiting = np.empty_like(arrival)
+    completion = np.empty_like(arrival)
+    turnaround = np.empty_like(arrival)
+    order = np.empty(n, np.int64)
+    if n == 0:
+        return waiting, completion, turnaround, order
+
+    # Ready queue of (key, index); the index breaks ties by earliest arrival
+    ready = [(key[0], 0)]
+    ready.pop()
+    next_arrival = 0
+    current_time = 0
+
+    for k in range(n):
+        # CPU is idle, skip ahead to the next arrival
+        if not ready and arrival[next_arrival] > current_time:
+            current_time = arrival[next_arrival]
+
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            heapq.heappush(ready, (key[next_arrival], next_arrival))
+            next_arrival += 1
+
+        i = heapq.heappop(ready)[1]
+        waiting[i] = current_time - arrival[i]
+        completion[i] = current_time + burst[i]
+        turnaround[i] = completion[i] - arrival[i]
+        current_time = completion[i]
+        order[k] = i
+    return waiting, completion, turnaround, order
+
+@njit(cache=True)
+def _sjf_kernel(arrival, burst):
+    return _lowest_key_kernel(arrival, burst, burst)
+
+@njit(cache=True)
+def _priority_kernel(arrival, burst, priority):
+    return _lowest_key_kernel(arrival, burst, priority)
+
+# Compile once at import so the first scheduling call doesn't pay for it
+_warmup = np.zeros(1, np.int64)
+_fcfs_loop_kernel(_warmup.astype(np.float64), _warmup.astype(np.float64))
+_sjf_kernel(_warmup, _warmup)
+_priority_kernel(_warmup, _warmup, _warmup)
+
 class Process:
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         self.pid = pid
@@ -13,107 +111,138 @@ class Process:
 
 class CPUScheduler:
     def __init__(self):
-        self.processes = []
+        # Process fields are stored column-wise; add_process appends to these lists
+        self._pids = []
+        self._arrivals = []
+        self._bursts = []
+        self._priorities = []
+        # (arrival_time, position) pairs kept sorted as processes are added
+        self._arrival_order = []
+        self._cache = {}
         
     def add_process(self, pid, arrival_time, burst_time, priority=0):
-        process = Process(pid, arrival_time, burst_time, priority)
-        self.processes.append(process)
+        self._pids.append(pid)
+        self._arrivals.append(arrival_time)
+        self._bursts.append(burst_time)
+        self._priorities.append(priority)
+        bisect.insort(self._arrival_order, (arrival_time, len(self._pids) - 1))
+        self._cache.clear()
+
+    def _memo(self, name, fn):
+        # Each algorithm runs once until the process list changes
+        if name not in self._cache:
+            self._cache[name] = fn()
+        return self._cache[name]
+
+    def _columns(self):
+        # Times share one dtype so fractional times are not truncated (int64 only when every time is an int)
+        def build():
+            time_dtype = np.result_type(np.asarray(self._arrivals), np.asarray(self._bursts))
+            return {
+                'arrival': np.asarray(self._arrivals, dtype=time_dtype),
+                'burst': np.asarray(self._bursts, dtype=time_dtype),
+                'priority': np.asarray(self._priorities)
+            }
+        return self._memo('columns', build)
+
+    @property
+    def arrival(self):
+        return self._columns()['arrival']
+
+    @property
+    def burst(self):
+        return self._columns()['burst']
+
+    @property
+    def priority(self):
+        return self._columns()['priority']
+
+    @property
+    def processes(self):
+        # Read-only snapshot: fresh Process copies in insertion order, editing them doesn't change
+        # the scheduler. It is a tuple so appending fails loudly; use add_process instead
+        return tuple(self._process_view(i) for i in range(len(self._pids)))
+
+    def _process_view(self, i, result=None):
+        process = Process(self._pids[i], self._arrivals[i], self._bursts[i], self._priorities[i])
+        if result is not None:
+            process.waiting_time = result['waiting'][i].item()
+            process.completion_time = result['completion'][i].item()
+            process.turnaround_time = result['turnaround'][i].item()
+        return process
+
+    def _by_arrival(self):
+        # Ties keep insertion order because the position is part of each sorted pair
+        return self._memo('by_arrival', lambda: np.array(
+            [i for _, i in self._arrival_order], dtype=np.int64))
+
+    def _run(self, kernel, *fields):
+        # Kernels work on arrival-sorted columns; map their output back to insertion order
+        by_arrival = self._by_arrival()
+        waiting, completion, turnaround, order = kernel(
+            *(self._columns()[field][by_arrival] for field in fields))
+
+        result = {'order': by_arrival[order]}
+        for name, values in (('waiting', waiting), ('completion', completion), ('turnaround', turnaround)):
+            result[name] = np.empty_like(values)
+            result[name][by_arrival] = values
+        return result
+
+    def _schedule(self, name):
+        if name == 'FCFS':
+            return self._memo(name, lambda: self._run(_fcfs_kernel, 'arrival', 'burst'))
+        if name == 'SJF':
+            return self._memo(name, lambda: self._run(_sjf_kernel, 'arrival', 'burst'))
+        return self._memo(name, self._priority_result)
+
+    def _priority_result(self):
+        # With a single priority level every tie goes to the earliest arrival, which is exactly FCFS
+        if len(set(self._priorities)) <= 1:
+            return self._schedule('FCFS')
+        return self._run(_priority_kernel, 'arrival', 'burst', 'priority')
+
+    def _result_views(self, name):
+        result = self._schedule(name)
+        return [self._process_view(i, result) for i in result['order']]
         
     def fcfs(self):
-        processes = sorted(self.processes, key=lambda x: x.arrival_time)
-        current_time = 0
-        result = []
-        
-        for process in processes:
-            if current_time < process.arrival_time:
-                current_time = process.arrival_time
-            
-            process.waiting_time = current_time - process.arrival_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            current_time = process.completion_time
-            
-            result.append(process)
-        return result
+        return self._result_views('FCFS')
 
     def sjf(self):
-        processes = sorted(self.processes, key=lambda x: x.arrival_time)
-        n = len(processes)
-        completed = []
-        current_time = 0
-        
-        while len(completed) < n:
-            available = [p for p in processes if p.arrival_time <= current_time and p not in completed]
-            
-            if not available:
-                current_time += 1
-                continue
-                
-            process = min(available, key=lambda x: x.burst_time)
-            process.waiting_time = current_time - process.arrival_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            current_time = process.completion_time
-            
-            completed.append(process)
-        return completed
+        return self._result_views('SJF')
 
     def priority_scheduling(self):
-        processes = sorted(self.processes, key=lambda x: x.arrival_time)
-        n = len(processes)
-        completed = []
-        current_time = 0
-        
-        while len(completed) < n:
-            available = [p for p in processes if p.arrival_time <= current_time and p not in completed]
-            
-            if not available:
-                current_time += 1
-                continue
-                
-            process = min(available, key=lambda x: x.priority)
-            process.waiting_time = current_time - process.arrival_time
-            process.completion_time = current_time + process.burst_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            current_time = process.completion_time
-            
-            completed.append(process)
-        return completed
+        return self._result_views('Priority')
 
-    def get_process_metrics(self, pid):
+    def _metrics_at(self, i):
         process_metrics = {}
-        
-        # FCFS metrics
-        fcfs_result = self.fcfs()
-        fcfs_process = next((p for p in fcfs_result if p.pid == pid), None)
-        if fcfs_process:
-            process_metrics['FCFS'] = {
-                'waiting_time': fcfs_process.waiting_time,
-                'turnaround_time': fcfs_process.turnaround_time
-            }
-            
-        # SJF metrics
-        sjf_result = self.sjf()
-        sjf_process = next((p for p in sjf_result if p.pid == pid), None)
-        if sjf_process:
-            process_metrics['SJF'] = {
-                'waiting_time': sjf_process.waiting_time,
-                'turnaround_time': sjf_process.turnaround_time
-            }
-            
-        # Priority metrics
-        priority_result = self.priority_scheduling()
-        priority_process = next((p for p in priority_result if p.pid == pid), None)
-        if priority_process:
-            process_metrics['Priority'] = {
-                'waiting_time': priority_process.waiting_time,
-                'turnaround_time': priority_process.turnaround_time
+        for algo in ('FCFS', 'SJF', 'Priority'):
+            result = self._schedule(algo)
+            process_metrics[algo] = {
+                'waiting_time': result['waiting'][i].item(),
+                'turnaround_time': result['turnaround'][i].item()
             }
-            
         return process_metrics
+
+    def _pid_index(self):
+        # pid -> position in the columns, built once per process list
+        def build():
+            index = {}
+            for i, pid in enumerate(self._pids):
+                index.setdefault(pid, i)
+            return index
+        return self._memo('pid_index', build)
+
+    def get_process_metrics(self, pid):
+        i = self._pid_index().get(pid)
+        if i is None:
+            return {}
+        return self._metrics_at(i)
     
-    def find_best_algorithm(self, pid):
-        metrics = self.get_process_metrics(pid)
+    def find_best_algorithm(self, pid, metrics=None):
+        # Callers that already have the metrics for pid can pass them in
+        if metrics is None:
+            metrics = self.get_process_metrics(pid)
         
         # Compare waiting times
         waiting_times = {algo: values['waiting_time'] 
@@ -130,62 +259,90 @@ class CPUScheduler:
             'best_turnaround_time': best_turnaround
         }
 
-    def plot_comparison_graphs(self):
-        if not self.processes:
+    def plot_comparison_graphs(self, save_only=False):
+        if not self._pids:
             print("No processes to plot! Please add processes first.")
             return
 
-        # For each process, get its metrics from each algorithm
-        for process in self.processes:
-            metrics = self.get_process_metrics(process.pid)
-            
-            # Prepare data for plotting
-            algorithms = list(metrics.keys())  # ['FCFS', 'SJF', 'Priority']
-            waiting_times = [metrics[algo]['waiting_time'] for algo in algorithms]
-            turnaround_times = [metrics[algo]['turnaround_time'] for algo in algorithms]
-
-            # Create two subplots for each process
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-            fig.suptitle(f'Process {process.pid} Metrics')
-
-            # Plot waiting times
-            bars1 = ax1.bar(algorithms, waiting_times, color=['skyblue', 'lightgreen', 'lightcoral'])
-            ax1.set_xlabel('Algorithms')
-            ax1.set_ylabel('Waiting Time')
-            ax1.set_title(f'Waiting Time Comparison for Process {process.pid}')
-            
-            # Add value labels on top of each bar
-            for bar in bars1:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height}',
-                        ha='center', va='bottom')
-
-            # Plot turnaround times
-            bars2 = ax2.bar(algorithms, turnaround_times, color=['skyblue', 'lightgreen', 'lightcoral'])
-            ax2.set_xlabel('Algorithms')
-            ax2.set_ylabel('Turnaround Time')
-            ax2.set_title(f'Turnaround Time Comparison for Process {process.pid}')
-            
-            # Add value labels on top of each bar
-            for bar in bars2:
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height}',
-                        ha='center', va='bottom')
-
-            # Find and display best algorithm for this process
-            best_waiting_algo = algorithms[waiting_times.index(min(waiting_times))]
-            best_turnaround_algo = algorithms[turnaround_times.index(min(turnaround_times))]
-            
-            plt.figtext(0.02, 0.02, 
-                       f'Best Waiting Time: {best_waiting_algo} ({min(waiting_times)})\n'
-                       f'Best Turnaround Time: {best_turnaround_algo} ({min(turnaround_times)})',
-                       fontsize=8)
+        fig = None
+        if save_only:
+            # Render off-screen into process_<pid>.png files. The figure lives outside pyplot,
+            # so the global backend and any figures the caller has open are left alone
+            fig = Figure(figsize=(10, 8))
+            FigureCanvasAgg(fig)
+            ax1, ax2 = fig.subplots(2, 1)
+            best_text = fig.text(0.02, 0.02, '', fontsize=8)
+
+        try:
+            # For each process, get its metrics from each algorithm
+            for i, pid in enumerate(self._pids):
+                metrics = self._metrics_at(i)
+                
+                # Prepare data for plotting
+                algorithms = list(metrics.keys())  # ['FCFS', 'SJF', 'Priority']
+                waiting_times = [metrics[algo]['waiting_time'] for algo in algorithms]
+                turnaround_times = [metrics[algo]['turnaround_time'] for algo in algorithms]
+
+                # The same figure is redrawn for each process. Closing its window destroys it,
+                # in which case a new one is created for the next process
+                if not save_only and (fig is None or not plt.fignum_exists(fig.number)):
+                    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+                    best_text = fig.text(0.02, 0.02, '', fontsize=8)
+                    # Closing the window also ends the wait for a key press below
+                    fig.canvas.mpl_connect('close_event', lambda event: event.canvas.stop_event_loop())
+                ax1.clear()
+                ax2.clear()
+                fig.suptitle(f'Process {pid} Metrics')
+
+                # Plot waiting times
+                bars1 = ax1.bar(algorithms, waiting_times, color=['skyblue', 'lightgreen', 'lightcoral'])
+                ax1.set_xlabel('Algorithms')
+                ax1.set_ylabel('Waiting Time')
+                ax1.set_title(f'Waiting Time Comparison for Process {pid}')
+                
+                # Add value labels on top of each bar
+                for bar in bars1:
+                    height = bar.get_height()
+                    ax1.text(bar.get_x() + bar.get_width()/2., height,
+                            f'{height}',
+                            ha='center', va='bottom')
+
+                # Plot turnaround times
+                bars2 = ax2.bar(algorithms, turnaround_times, color=['skyblue', 'lightgreen', 'lightcoral'])
+                ax2.set_xlabel('Algorithms')
+                ax2.set_ylabel('Turnaround Time')
+                ax2.set_title(f'Turnaround Time Comparison for Process {pid}')
+                
+                # Add value labels on top of each bar
+                for bar in bars2:
+                    height = bar.get_height()
+                    ax2.text(bar.get_x() + bar.get_width()/2., height,
+                            f'{height}',
+                            ha='center', va='bottom')
+
+                # Find and display best algorithm for this process
+                best_algos = self.find_best_algorithm(pid, metrics)
+                best_waiting_algo, best_waiting_time = best_algos['best_waiting_time']
+                best_turnaround_algo, best_turnaround_time = best_algos['best_turnaround_time']
+                
+                best_text.set_text(f'Best Waiting Time: {best_waiting_algo} ({best_waiting_time})\n'
+                                   f'Best Turnaround Time: {best_turnaround_algo} ({best_turnaround_time})')
 
-            # Adjust layout and display
-            plt.tight_layout()
-            plt.show()
+                # Adjust layout and display
+                fig.tight_layout()
+                if save_only:
+                    fig.savefig(f"process_{pid}.png")
+                elif type(fig.canvas).start_event_loop is FigureCanvasBase.start_event_loop:
+                    # Non-GUI backend, there is no window to keep open
+                    plt.show()
+                else:
+                    # Keep the window open and move on to the next process on a key press or click
+                    print(f"Showing Process {pid}, press a key or click the graph to continue...")
+                    fig.canvas.draw_idle()
+                    fig.waitforbuttonpress()
+        finally:
+            if fig is not None and not save_only:
+                plt.close(fig)
 
 def main():
     scheduler = CPUScheduler()
@@ -220,7 +377,8 @@ def main():
                 print(f"Turnaround Time: {values['turnaround_time']}")
                 
         elif choice == '3':
-            scheduler.plot_comparison_graphs()
+            save_only = input("Save graphs as PNG files instead of showing them? (y/n): ").strip().lower() == 'y'
+            scheduler.plot_comparison_graphs(save_only=save_only)
             
         elif choice == '4':
             pid = int(input("Enter Process ID to find best algorithm: "))
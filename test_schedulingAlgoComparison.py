@@ -0,0 +1,38 @@
+from schedulingAlgoComparison import CPUScheduler
+
+
+def test_float_times_are_not_truncated():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 2.5)
+    scheduler.add_process(2, 1, 2)
+
+    for algo in ('FCFS', 'Priority'):
+        assert scheduler.get_process_metrics(2)[algo] == {'waiting_time': 1.5, 'turnaround_time': 3.5}
+
+
+def test_float_immediate_start_has_zero_waiting_time():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0.5, 0.2)
+
+    for values in scheduler.get_process_metrics(1).values():
+        assert values['waiting_time'] == 0.0
+
+
+def test_string_pids():
+    scheduler = CPUScheduler()
+    scheduler.add_process('p1', 0, 3)
+    scheduler.add_process('p2', 1, 1)
+
+    assert [p.pid for p in scheduler.sjf()] == ['p1', 'p2']
+    assert scheduler.get_process_metrics('p2')['SJF'] == {'waiting_time': 2, 'turnaround_time': 3}
+
+
+def test_equal_priorities_match_fcfs_with_float_times():
+    scheduler = CPUScheduler()
+    for pid, arrival_time, burst_time in [(1, 0, 5.25), (2, 1.5, 0.3), (3, 0.5, 2.2), (4, 20.1, 1.3)]:
+        scheduler.add_process(pid, arrival_time, burst_time)
+
+    fcfs = [(p.pid, p.waiting_time, p.completion_time) for p in scheduler.fcfs()]
+    priority = [(p.pid, p.waiting_time, p.completion_time) for p in scheduler.priority_scheduling()]
+    assert priority == fcfs
+    assert scheduler.get_process_metrics(4)['Priority']['waiting_time'] == 0.0